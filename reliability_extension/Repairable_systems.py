@@ -16,14 +16,447 @@ MCF_parametric - Mean Cumulative Function Parametric. Fits a parametric model to
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+from functools import lru_cache
 from scipy import integrate
+from scipy.special import gamma, gammainc, ndtri
 import pandas as pd
-import scipy.stats as ss
-from scipy.optimize import curve_fit
+from scipy.optimize import curve_fit, minimize_scalar
 from reliability_extension.Utils import colorprint, round_to_decimals
-from matplotlib.ticker import ScalarFormatter
-from matplotlib.axes import SubplotBase
+
+
+def _SF_integral(x, weibull_alpha, weibull_beta):
+    """
+    The integral of the Weibull SF from 0 to x. This is the closed form using
+    the regularized lower incomplete gamma function so it accepts arrays and
+    broadcasts like any other ufunc.
+
+    Parameters
+    ----------
+    x : float, array
+        The upper limit(s) of the integral.
+    weibull_alpha : int, float
+        The scale parameter of the underlying Weibull distribution.
+    weibull_beta : int, float
+        The shape parameter of the underlying Weibull distribution.
+
+    Returns
+    -------
+    integral : float, array
+        The integral of the SF from 0 to x.
+    """
+    k = 1 / weibull_beta
+    return (
+        weibull_alpha
+        * k
+        * gamma(k)
+        * gammainc(k, (np.asarray(x) / weibull_alpha) ** weibull_beta)
+    )
+
+
+@lru_cache(maxsize=128)
+def _SF_grid(weibull_alpha, weibull_beta, t_max, points):
+    """
+    Evaluates the Weibull SF and its integral over an evenly spaced grid of
+    times from 1 to t_max. The results are cached since they only depend on
+    the distribution and the grid, not on the costs.
+
+    Parameters
+    ----------
+    weibull_alpha : int, float
+        The scale parameter of the underlying Weibull distribution.
+    weibull_beta : int, float
+        The shape parameter of the underlying Weibull distribution.
+    t_max : int, float
+        The last time in the grid.
+    points : int
+        The number of points in the grid.
+
+    Returns
+    -------
+    t : array
+        The grid of times.
+    sf : array
+        The survival function at each time.
+    integral : array
+        The integral of the survival function from 0 to each time.
+
+    Notes
+    -----
+    The arrays are shared between calls so they are returned as read-only.
+
+    The SF is evaluated in place so the grid only allocates one array for it.
+    The integral is accumulated along the grid with the trapezoidal rule and
+    the area between 0 and t[0] is added using _SF_integral.
+    """
+    t = np.linspace(1, t_max, points)
+    sf = np.divide(t, weibull_alpha)
+    np.power(sf, weibull_beta, out=sf)
+    np.negative(sf, out=sf)
+    np.exp(sf, out=sf)
+
+    integral = integrate.cumulative_trapezoid(sf, t, initial=0)
+    integral += _SF_integral(t[0], weibull_alpha, weibull_beta)
+
+    for arr in [t, sf, integral]:
+        arr.flags.writeable = False
+    return t, sf, integral
+
+
+def _ORT_cost_grid(sf, integral, cost_PM, cost_CM):
+    """
+    Evaluates the as good as new (q=0) cost model of optimal_replacement_time
+    from the SF and its integral.
+
+    Parameters
+    ----------
+    sf : array
+        The survival function at each time.
+    integral : array
+        The integral of the survival function from 0 to each time.
+    cost_PM : int, float
+        The cost of preventative maintenance.
+    cost_CM : int, float
+        The cost of corrective maintenance.
+
+    Returns
+    -------
+    CPUT : array
+        The cost per unit time at each time.
+    PPUT : array
+        The preventative component of the cost per unit time.
+    RPUT : array
+        The reactive (corrective) component of the cost per unit time.
+    """
+    # integral is strictly positive since it includes the area up to t[0]
+    inv_integral = 1 / integral
+    PPUT = cost_PM * sf * inv_integral
+    RPUT = cost_CM * (1 - sf) * inv_integral
+    CPUT = PPUT + RPUT
+    return CPUT, PPUT, RPUT
+
+
+def _MCF_calculations(is_failure, number_of_systems, Z):
+    """
+    Performs the MCF calculations of MCF_nonparametric over the sorted events.
+
+    Parameters
+    ----------
+    is_failure : array
+        An array of uint8 which is 1 for a failure and 0 for a censored value.
+        The events must be sorted by time and where times are equal the
+        failures must come before the censored values.
+    number_of_systems : int
+        The number of systems. This is the number of censored values.
+    Z : float
+        The Z-value of the confidence interval.
+
+    Returns
+    -------
+    MCF : array
+        The MCF at each event.
+    Var : array
+        The variance of the MCF at each event.
+    MCF_lower : array
+        The lower confidence bound on the MCF at each event.
+    MCF_upper : array
+        The upper confidence bound on the MCF at each event.
+    valid : array
+        A boolean mask which is True where the row has values. Rows of censored
+        values are False and are NaN in the other arrays.
+
+    Notes
+    -----
+    Each failure adds 1/r to the MCF where r is the number of systems that
+    have not yet been retired, so the MCF and its variance are cumulative sums
+    over the failures.
+    """
+    n = len(is_failure)
+    failures = is_failure == 1
+    r = number_of_systems - np.cumsum(1 - is_failure)[failures]
+    r_inv = 1 / r
+
+    MCF = np.full(n, np.nan)
+    Var = np.full(n, np.nan)
+    MCF_lower = np.full(n, np.nan)
+    MCF_upper = np.full(n, np.nan)
+    MCF_f = np.cumsum(r_inv)
+    Var_f = np.cumsum((r_inv ** 2) * ((1 - r_inv) ** 2 + (r - 1) * (0 - r_inv) ** 2))
+    # the lower and upper bounds share the same factor
+    factor = np.exp(Z * np.sqrt(Var_f) / MCF_f)
+    MCF[failures] = MCF_f
+    Var[failures] = Var_f
+    MCF_lower[failures] = MCF_f / factor
+    MCF_upper[failures] = MCF_f * factor
+    return MCF, Var, MCF_lower, MCF_upper, failures
+
+
+def _MCF_CI_bands(x, alpha, beta, var_alpha, var_beta, cov_alpha_beta, Z):
+    """
+    Evaluates the fitted MCF of MCF_parametric and its confidence bounds.
+
+    Parameters
+    ----------
+    x : array
+        The times at which to evaluate the MCF.
+    alpha : float
+        The fitted scale parameter.
+    beta : float
+        The fitted shape parameter.
+    var_alpha : float
+        The variance of alpha.
+    var_beta : float
+        The variance of beta.
+    cov_alpha_beta : float
+        The covariance of alpha and beta.
+    Z : float
+        The Z-value of the confidence interval.
+
+    Returns
+    -------
+    MCF : array
+        The MCF at each time.
+    MCF_lower : array
+        The lower confidence bound on the MCF at each time.
+    MCF_upper : array
+        The upper confidence bound on the MCF at each time.
+
+    Notes
+    -----
+    The variance is found using the delta method with the partial derivatives
+    of the MCF with respect to alpha and beta.
+    """
+    ratio = x / alpha
+    MCF = ratio ** beta
+    p1 = -(beta / alpha) * MCF
+    p2 = MCF * np.log(ratio)
+    var = var_alpha * p1 ** 2 + var_beta * p2 ** 2 + 2 * p1 * p2 * cov_alpha_beta
+    factor = np.exp(Z * np.sqrt(var) / MCF)
+    return MCF, MCF / factor, MCF * factor
+
+
+def _format_mcf_table(states, times, lower, MCF, upper, var):
+    """
+    Formats the results of MCF_nonparametric as a table for printing.
+
+    Parameters
+    ----------
+    states : array
+        The state ("F" or "C") of each event.
+    times : array
+        The time of each event.
+    lower : array
+        The lower confidence bound on the MCF. NaN for censored events.
+    MCF : array
+        The MCF. NaN for censored events.
+    upper : array
+        The upper confidence bound on the MCF. NaN for censored events.
+    var : array
+        The variance of the MCF. NaN for censored events.
+
+    Returns
+    -------
+    table : str
+        The table with the columns right aligned and the NaN values blank.
+
+    Notes
+    -----
+    The layout is similar to DataFrame.to_string(index=False) but it is not
+    identical. Pandas reserves a character for the sign in numeric columns,
+    and this table does not, so some columns are one character narrower. The
+    values are formatted to 6 significant figures.
+    """
+    headers = ["state", "time", "MCF_lower", "MCF", "MCF_upper", "variance"]
+    fmt = lambda v: "" if np.isnan(v) else "{:.6g}".format(v)
+    columns = [list(states)]
+    for col in [times, lower, MCF, upper, var]:
+        columns.append([fmt(v) for v in col])
+    widths = [
+        max(len(header), max(len(item) for item in col))
+        for header, col in zip(headers, columns)
+    ]
+    rows = [headers] + list(zip(*columns))
+    return "\n".join(
+        " ".join(item.rjust(width) for item, width in zip(row, widths))
+        for row in rows
+    )
+
+
+def _MCF_events_from_lists(data):
+    """
+    Converts the list of lists input of MCF_nonparametric into the event times
+    and censoring flags.
+
+    Parameters
+    ----------
+    data : list, array
+        The times for each system as a list of lists (or a list of arrays). A
+        single list of numbers is treated as one system.
+
+    Returns
+    -------
+    times : array
+        The times of all the events. These are not sorted.
+    is_cens : array
+        An array of uint8 which is 1 for the end time of each system and 0 for
+        the repair times.
+    """
+    # check input is a list
+    if type(data) == list:
+        pass
+    elif type(data) == np.ndarray:
+        data = list(data)
+    else:
+        raise ValueError("data must be a list or numpy array")
+
+    # check each item is a list and fix up any ndarrays to be lists.
+    test_for_single_system = []
+    for i, item in enumerate(data):
+        if type(item) == list:
+            test_for_single_system.append(False)
+        elif type(item) == np.ndarray:
+            data[i] = list(item)
+            test_for_single_system.append(False)
+        elif type(item) == int or type(item) == float:
+            test_for_single_system.append(True)
+        else:
+            raise ValueError(
+                "Each item in the data must be a list or numpy array. eg. data = [[1,3,5],[3,6,8]]"
+            )
+    # Wraps the data in another list if all elements were numbers.
+    if all(test_for_single_system):  # checks if all are True
+        data = [data]
+    elif not any(test_for_single_system):  # checks if all are False
+        pass
+    else:
+        raise ValueError(
+            "Mixed data types found in the data. Each item in the data must be a list or numpy array. eg. data = [[1,3,5],[3,6,8]]."
+        )
+
+    # each system contributes its repair times (F) followed by its end time (C).
+    # The largest time of each system is the end time so it is swapped into
+    # the last position. The repair times do not need to be in order since
+    # all the times are sorted together by MCF_nonparametric.
+    times = np.empty(sum(len(system) for system in data), dtype=np.float64)
+    is_cens = np.zeros(len(times), dtype=np.uint8)
+    pos = 0
+    for system in data:
+        if len(system) == 0:
+            continue
+        pos_end = pos + len(system)
+        times[pos:pos_end] = system
+        idx = pos + np.argmax(times[pos:pos_end])
+        times[idx], times[pos_end - 1] = times[pos_end - 1], times[idx]
+        is_cens[pos_end - 1] = 1
+        pos = pos_end
+    return times, is_cens
+
+
+def _MCF_events_from_padded(data):
+    """
+    Converts a 2D array input of MCF_nonparametric into the event times and
+    censoring flags.
+
+    Parameters
+    ----------
+    data : array
+        A 2D array with one row for each system. Rows with fewer times are
+        padded with NaN.
+
+    Returns
+    -------
+    times : array
+        The times of all the events. These are not sorted.
+    is_cens : array
+        An array of uint8 which is 1 for the end time of each system and 0 for
+        the repair times.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    data = data[~np.isnan(data).all(axis=1)]  # rows of NaN are empty systems
+    valid = ~np.isnan(data)
+    # the largest time in each row is the end time
+    is_end = np.zeros(data.shape, dtype=np.uint8)
+    is_end[np.arange(len(data)), np.nanargmax(data, axis=1)] = 1
+    return data[valid], is_end[valid]
+
+
+def _MCF_events_from_ids(data):
+    """
+    Converts a (times, system_ids) input of MCF_nonparametric into the event
+    times and censoring flags.
+
+    Parameters
+    ----------
+    data : tuple
+        A tuple of two arrays of the same length. The first is the times of the
+        events and the second is the system that each time belongs to.
+
+    Returns
+    -------
+    times : array
+        The times of all the events, ordered by system and then by time.
+    is_cens : array
+        An array of uint8 which is 1 for the end time of each system and 0 for
+        the repair times.
+    """
+    if len(data) != 2:
+        raise ValueError(
+            "If data is a tuple it must be (times, system_ids). eg. data = ([4, 7, 9, 3, 8, 12], [1, 1, 1, 2, 2, 2])"
+        )
+    times = np.asarray(data[0], dtype=np.float64)
+    system_ids = np.asarray(data[1])
+    if times.ndim != 1 or times.shape != system_ids.shape:
+        raise ValueError("times and system_ids must be 1D and the same length.")
+    order = np.lexsort((times, system_ids))
+    times = times[order]
+    system_ids = system_ids[order]
+    # the largest time of each system is the last one for that system
+    is_cens = np.ones(len(times), dtype=np.uint8)
+    is_cens[:-1] = system_ids[1:] != system_ids[:-1]
+    return times, is_cens
+
+
+def _MCF_eqn(t, a, b):
+    """
+    The power law model of the MCF that is fitted by MCF_parametric.
+
+    Parameters
+    ----------
+    t : array
+        The times at which to evaluate the MCF.
+    a : float
+        The scale parameter (alpha).
+    b : float
+        The shape parameter (beta).
+
+    Returns
+    -------
+    MCF : array
+        The MCF at each time.
+    """
+    return (t / a) ** b
+
+
+def _MCF_jac(t, a, b):
+    """
+    The partial derivatives of _MCF_eqn with respect to a and b. This is
+    passed to curve_fit so it does not need to use finite differences.
+
+    Parameters
+    ----------
+    t : array
+        The times at which to evaluate the derivatives.
+    a : float
+        The scale parameter (alpha).
+    b : float
+        The shape parameter (beta).
+
+    Returns
+    -------
+    jac : array
+        An array of shape (len(t), 2) with the derivatives wrt a and b.
+    """
+    MCF = (t / a) ** b
+    return np.column_stack([-(b / a) * MCF, MCF * np.log(t / a)])
 
 
 class reliability_growth:
@@ -98,7 +531,7 @@ class reliability_growth:
         **kwargs
     ):
         if type(times) in [list, np.ndarray]:
-            times = np.sort(np.asarray(times))
+            times = np.sort(np.asarray(times, dtype=np.float64))
         else:
             raise ValueError("times must be an array or list of failure times")
 
@@ -124,12 +557,14 @@ class reliability_growth:
             raise ValueError('method must be either "Duane" or "Crow-AMSAA".')
 
         n = len(times)
-        max_time = max(times)
-        failure_numbers = np.array(range(1, n + 1))
+        log_times = np.log(times)
+        max_time = times[-1]  # times is sorted
+        log_max = log_times[-1]
+        failure_numbers = np.arange(1, n + 1, dtype=np.int64)
         MTBF_c = times / failure_numbers
 
         if model == "Crow-AMSAA":
-            self.Beta = n / (n * np.log(max_time) - np.log(times).sum())
+            self.Beta = n / (n * log_max - log_times.sum())
             self.Lambda = n / (max_time ** self.Beta)
             self.growth_rate = 1 - self.Beta
             self.DMTBF_I = 1 / (self.Lambda * self.Beta * max_time ** (self.Beta - 1)) # Demonstrated MTBF (instantaneous). Reported by reliasoft
@@ -137,12 +572,17 @@ class reliability_growth:
             self.DMTBF_C = (1/self.Lambda)*max_time**(1-self.Beta) # Demonstrated failure intensity (cumulative)
             self.DFI_C = 1/ self.DMTBF_C # Demonstrated MTBF (cumulative)
         else:  # Duane
-            x = np.log(times)
+            x = log_times
             y = np.log(MTBF_c)
-            # fit a straight line to the data to get the model parameters
-            z = np.polyfit(x, y, 1)
-            self.Alpha = z[0]
-            b = np.exp(z[1])
+            # fit a straight line to the data to get the model parameters.
+            # This is ordinary least squares so the closed form is used.
+            x_mean = x.mean()
+            y_mean = y.mean()
+            dx = x - x_mean
+            slope = (dx * (y - y_mean)).sum() / (dx ** 2).sum()
+            intercept = y_mean - slope * x_mean
+            self.Alpha = slope
+            b = np.exp(intercept)
             self.DMTBF_C = b * (max_time ** self.Alpha)  # Demonstrated MTBF (cumulative)
             self.DFI_C = 1 / self.DMTBF_C  # Demonstrated failure intensity (cumulative)
             self.DFI_I = (1 - self.Alpha) * self.DFI_C # Demonstrated failure intensity (instantaneous). Reported by reliasoft
@@ -189,6 +629,9 @@ class reliability_growth:
             print('') #blank line
 
         if show_plot is True:
+            import matplotlib.pyplot as plt
+            from matplotlib.ticker import ScalarFormatter
+
             if log_scale is True:
                 xmax = 10 ** np.ceil(np.log10(max(max_time, t_target)))
                 x_array = np.geomspace(0.00001, xmax * 100, 1000)
@@ -196,10 +639,20 @@ class reliability_growth:
                 xmax = max(max_time, t_target) * 2
                 x_array = np.linspace(0, xmax, 1000)
 
+            # the powers are evaluated in log space so log(x) is only computed
+            # once. x_array starts at 0 on the linear scale which gives -inf.
             if model == "Crow-AMSAA":
-                MTBF = 1 / (self.Lambda * x_array ** (self.Beta - 1))
+                log_coefficient = -np.log(self.Lambda)
+                exponent = 1 - self.Beta
             else:  # Duane
-                MTBF = b * x_array ** self.Alpha
+                log_coefficient = np.log(b)
+                exponent = self.Alpha
+            if exponent == 0:  # x**0 is 1 even at x=0 where 0 * -inf is NaN
+                MTBF = np.full(x_array.shape, np.exp(log_coefficient))
+            else:
+                with np.errstate(divide="ignore"):
+                    log_x = np.log(x_array)
+                MTBF = np.exp(log_coefficient + exponent * log_x)
 
             # kwargs handling
             if "color" in kwargs:
@@ -354,52 +807,71 @@ class optimal_replacement_time:
                 text_color="red",
             )
 
+        # matplotlib is only imported if a plot may be needed
+        time_plot = show_time_plot is True
+        ratio_plot = show_ratio_plot is True
+        if show_time_plot is not False or show_ratio_plot is not False:
+            import matplotlib.pyplot as plt
+            from matplotlib.axes import SubplotBase
+
+            if issubclass(type(show_time_plot), SubplotBase) is True:
+                time_plot = True
+            if issubclass(type(show_ratio_plot), SubplotBase) is True:
+                ratio_plot = True
+
         if q == 1:  # as good as old
             alpha_multiple = 4
-            t = np.linspace(1, weibull_alpha * alpha_multiple, 100000)
-            CPUT = ((cost_PM * (t / weibull_alpha) ** weibull_beta) + cost_CM) / t
             ORT = weibull_alpha * (
                 (cost_CM / (cost_PM * (weibull_beta - 1))) ** (1 / weibull_beta)
             )
             min_cost = (
                 (cost_PM * (ORT / weibull_alpha) ** weibull_beta) + cost_CM
             ) / ORT
-
-            reactive_cost = CPUT[-1]
-            #idx = np.argmin(np.abs(t - unit_year))
-            #if isinstance(idx, np.ndarray):
-            #    idx=idx[0]
-            #yearly_cost = CPUT[idx]
-            # todo: implement  the preventive cost per unit time for the q=1 case
-            PPUT=  [None]*len(t)
-            RPUT= [None]*len(t)
+            # the cost at the end of the plotted range
+            reactive_cost = (
+                (cost_PM * alpha_multiple ** weibull_beta) + cost_CM
+            ) / (weibull_alpha * alpha_multiple)
+
+            # the grid is only needed for plotting
+            if time_plot is True:
+                t = np.linspace(1, weibull_alpha * alpha_multiple, 100000)
+                CPUT = ((cost_PM * (t / weibull_alpha) ** weibull_beta) + cost_CM) / t
+                # todo: implement  the preventive cost per unit time for the q=1 case
+                PPUT=  [None]*len(t)
+                RPUT= [None]*len(t)
         elif q == 0:  # as good as new
             alpha_multiple = 3
-            t = np.linspace(1, weibull_alpha * alpha_multiple, 10000)
-
-            # survival function and its integral
-            calc_SF = lambda x: np.exp(-((x / weibull_alpha) ** weibull_beta))
-            integrate_SF = lambda x: integrate.quad(calc_SF, 0, x)[0]
 
-            # vectorize them
-            vcalc_SF = np.vectorize(calc_SF)
-            vintegrate_SF = np.vectorize(integrate_SF)
-
-            # calculate the SF and intergral at each time
-            sf = vcalc_SF(t)
-            integral = vintegrate_SF(t)
-
-            CPUT = (cost_PM * sf + cost_CM * (1 - sf)) / integral
-            RPUT=  cost_CM * (1 - sf) / integral
-            PPUT= (cost_PM * sf ) / integral
-            idx = np.argmin(CPUT)
-            min_cost = CPUT[idx]  # minimum cost per unit time
-            ORT = t[idx]  # optimal replacement time
+            def calc_CPUT(x):  # cost per unit time at replacement time x
+                sf_x = np.exp(-((x / weibull_alpha) ** weibull_beta))
+                return (cost_PM * sf_x + cost_CM * (1 - sf_x)) / _SF_integral(
+                    x, weibull_alpha, weibull_beta
+                )
 
-            #sf_y = vcalc_SF(unit_year)
-            #integral_y = vintegrate_SF(unit_year)
-            #yearly_cost = (cost_PM * sf_y + cost_CM * (1 - sf_y)) / integral_y
-            reactive_cost = CPUT[-1]
+            # a coarse scan brackets the minimum which is then refined
+            t_coarse = np.linspace(1, weibull_alpha * alpha_multiple, 500)
+            k = np.argmin(calc_CPUT(t_coarse))
+            lo = t_coarse[max(k - 1, 0)]
+            hi = t_coarse[min(k + 1, len(t_coarse) - 1)]
+            # t_coarse runs downward when weibull_alpha * alpha_multiple < 1
+            bounds = (min(lo, hi), max(lo, hi))
+            res = minimize_scalar(calc_CPUT, bounds=bounds, method="bounded")
+            ORT = res.x  # optimal replacement time
+            min_cost = res.fun  # minimum cost per unit time
+            # the bounded search stops just inside the bracket so the edges are
+            # checked for when the minimum is at the end of the search range
+            for edge in bounds:
+                edge_cost = calc_CPUT(edge)
+                if edge_cost < min_cost:
+                    ORT, min_cost = edge, edge_cost
+            reactive_cost = calc_CPUT(weibull_alpha * alpha_multiple)
+
+            # the dense grid is only needed for plotting
+            if time_plot is True or ratio_plot is True:
+                t, sf, integral = _SF_grid(
+                    weibull_alpha, weibull_beta, weibull_alpha * alpha_multiple, 10000
+                )
+                CPUT, PPUT, RPUT = _ORT_cost_grid(sf, integral, cost_PM, cost_CM)
 
         else:
             raise ValueError(
@@ -428,11 +900,8 @@ class optimal_replacement_time:
                 ORT_rounded,
             )
 
-        if (
-            show_time_plot is True
-            or issubclass(type(show_time_plot), SubplotBase) is True
-        ):
-            if issubclass(type(show_time_plot), SubplotBase) is True:
+        if time_plot is True:
+            if show_time_plot is not True:
                 plt.sca(ax=show_time_plot)  # use the axes passed
             else:
                 plt.figure()  # if no axes is passed, make a new figure
@@ -463,31 +932,32 @@ class optimal_replacement_time:
             plt.ylim([0, min_cost * 2])
             plt.xlim([0, weibull_alpha * alpha_multiple])
 
-        if (
-            show_ratio_plot is True
-            or issubclass(type(show_ratio_plot), SubplotBase) is True
-        ):
-            if issubclass(type(show_ratio_plot), SubplotBase) is True:
+        if ratio_plot is True:
+            if show_ratio_plot is not True:
                 plt.sca(ax=show_ratio_plot)  # use the axes passed
             else:
                 plt.figure()  # if no axes is passed, make a new figure
             xupper = np.round(cost_CM / cost_PM, 0) * 2
             CC_CP = np.linspace(1, xupper, 200)  # cost CM / cost PM
             CC = CC_CP * cost_PM
-            ORT_array = []  # optimal replacement time
 
-            # get the ORT from the minimum CPUT for each CC
+            # get the ORT (optimal replacement time) from the minimum CPUT for each CC
             if q == 1:
-                calc_ORT = lambda x: weibull_alpha * (
-                    (x / (cost_PM * (weibull_beta - 1))) ** (1 / weibull_beta)
+                ORT_array = weibull_alpha * (
+                    (CC / (cost_PM * (weibull_beta - 1))) ** (1 / weibull_beta)
                 )
             else:  # q = 0
-                calc_ORT = lambda x: t[
-                    np.argmin((cost_PM * sf + x * (1 - sf)) / integral)
-                ]
-
-            vcalc_ORT = np.vectorize(calc_ORT)
-            ORT_array = vcalc_ORT(CC)
+                # each row of CPUT_mat is the cost curve for one value of CC.
+                # Only the location of each minimum is needed so float32 is
+                # used to halve the size of the matrix.
+                sf32 = sf.astype(np.float32)
+                inv_integral32 = (1 / integral).astype(np.float32)
+                CC32 = CC.astype(np.float32)
+                CPUT_mat = (
+                    np.float32(cost_PM) * sf32[None, :]
+                    + CC32[:, None] * (1 - sf32)[None, :]
+                ) * inv_integral32[None, :]
+                ORT_array = t[np.argmin(CPUT_mat, axis=1)]
 
             plt.plot(CC_CP, ORT_array)
             plt.xlim(1, xupper)
@@ -601,27 +1071,19 @@ class ROCOF:
                 "You have specified both times_between_failures and failure times. You can specify one but not both. Use times_between_failures for failure interarrival times, and failure_times for the actual failure times. failure_times should be the same as np.cumsum(times_between_failures)"
             )
         if times_between_failures is not None:
-            if any(t <= 0 for t in times_between_failures):
-                raise ValueError("times_between_failures cannot be less than zero")
-            if type(times_between_failures) == list:
-                ti = times_between_failures
-            elif type(times_between_failures) == np.ndarray:
-                ti = list(times_between_failures)
-            else:
+            if type(times_between_failures) not in [list, np.ndarray]:
                 raise ValueError("times_between_failures must be a list or array")
+            ti = np.asarray(times_between_failures, dtype=np.float64)
+            if (ti <= 0).any():
+                raise ValueError("times_between_failures cannot be less than zero")
         if failure_times is not None:
-            if any(t <= 0 for t in failure_times):
-                raise ValueError("failure_times cannot be less than zero")
-            if type(failure_times) == list:
-                failure_times = np.sort(np.array(failure_times))
-            elif type(failure_times) == np.ndarray:
-                failure_times = np.sort(failure_times)
-            else:
+            if type(failure_times) not in [list, np.ndarray]:
                 raise ValueError("failure_times must be a list or array")
-            failure_times[1:] -= failure_times[
-                :-1
-            ].copy()  # this is the opposite of np.cumsum
-            ti = list(failure_times)
+            failure_times = np.sort(np.asarray(failure_times, dtype=np.float64))
+            if (failure_times <= 0).any():
+                raise ValueError("failure_times cannot be less than zero")
+            # this is the opposite of np.cumsum
+            ti = np.concatenate(([failure_times[0]], np.diff(failure_times)))
         if test_end is not None and type(test_end) not in [float, int]:
             raise ValueError(
                 "test_end should be a float or int. Use test_end to specify the end time of a test which was not failure terminated."
@@ -631,12 +1093,12 @@ class ROCOF:
                 "CI must be between 0 and 1. Default is 0.95 for 95% confidence interval."
             )
         if test_end is None:
-            tn = sum(ti)
-            n = len(ti) - 1
+            tn = ti.sum()
+            n = ti.size - 1
         else:
             tn = test_end
-            n = len(ti)
-            if tn < sum(ti):
+            n = ti.size
+            if tn < ti.sum():
                 raise ValueError("test_end cannot be less than the final test time")
 
         if "linestyle" in kwargs:
@@ -648,9 +1110,9 @@ class ROCOF:
         else:
             label_1 = "Failure interarrival times"
 
-        tc = np.cumsum(ti[0:n])
-        sum_tc = sum(tc)
-        z_crit = ss.norm.ppf((1 - CI) / 2)  # z statistic based on CI
+        tc = np.cumsum(ti[:n])
+        sum_tc = tc.sum()
+        z_crit = ndtri((1 - CI) / 2)  # z statistic based on CI
         U = (sum_tc / n - tn / 2) / (tn * (1 / (12 * n)) ** 0.5)
         self.U = U
         self.z_crit = (z_crit, -z_crit)
@@ -664,41 +1126,42 @@ class ROCOF:
             + ")"
         )
 
-        x = np.arange(1, len(ti) + 1)
+        x = np.arange(1, ti.size + 1)
+        log_tc = np.log(tc)  # sum(log(tn/tc)) = n*log(tn) - sum(log(tc))
         if U < z_crit:
-            B = len(ti) / (sum(np.log(tn / np.array(tc))))
-            L = len(ti) / (tn ** B)
+            B = ti.size / (n * np.log(tn) - log_tc.sum())
+            L = ti.size / (tn ** B)
             self.trend = "improving"
             self.Beta_hat = B
             self.Lambda_hat = L
             self.ROCOF = "ROCOF is not provided when trend is not constant. Use Beta_hat and Lambda_hat to calculate ROCOF at a given time t."
             _rocof = L * B * tc ** (B - 1)
-            MTBF = np.ones_like(tc) / _rocof
+            MTBF = 1 / _rocof
             if test_end is not None:
                 x_to_plot = x
             else:
                 x_to_plot = x[:-1]
         elif U > -z_crit:
-            B = len(ti) / (sum(np.log(tn / np.array(tc))))
-            L = len(ti) / (tn ** B)
+            B = ti.size / (n * np.log(tn) - log_tc.sum())
+            L = ti.size / (tn ** B)
             self.trend = "worsening"
             self.Beta_hat = B
             self.Lambda_hat = L
             self.ROCOF = "ROCOF is not provided when trend is not constant. Use Beta_hat and Lambda_hat to calculate ROCOF at a given time t."
             _rocof = L * B * tc ** (B - 1)
-            MTBF = np.ones_like(tc) / _rocof
+            MTBF = 1 / _rocof
             if test_end is not None:
                 x_to_plot = x
             else:
                 x_to_plot = x[:-1]
         else:
-            rocof = (n + 1) / sum(ti)
+            rocof = (n + 1) / ti.sum()
             self.trend = "constant"
             self.ROCOF = rocof
             self.Beta_hat = "not calculated when trend is constant"
             self.Lambda_hat = "not calculated when trend is constant"
             x_to_plot = x
-            MTBF = np.ones_like(x_to_plot) / rocof
+            MTBF = np.full(x_to_plot.shape, 1 / rocof)
 
         CI_rounded = CI * 100
         if CI_rounded % 1 == 0:
@@ -750,6 +1213,8 @@ class ROCOF:
                 )
 
         if show_plot is True:
+            import matplotlib.pyplot as plt
+
             plt.plot(x_to_plot, MTBF, linestyle=ls, label="MTBF")
             plt.scatter(x, ti, label=label_1, **kwargs)
             plt.ylabel("Times between failures")
@@ -796,7 +1261,10 @@ class MCF_nonparametric:
         be entered as data = [4,7,9,9] since the last value is treated as a
         right censored value. If you only have data from 1 system you may enter
         the data in a single list as data = [3,7,12] and it will be nested
-        within another list automatically.
+        within another list automatically. The data may also be a 2D array with
+        one row for each system padded with NaN, or a tuple of
+        (times, system_ids) where system_ids gives the system of each time. eg.
+        data=([4,7,9,3,8,12],[1,1,1,2,2,2]) is the same as the example above.
     print_results : bool, optional
         Prints the table of MCF results (state, time, MCF_lower, MCF, MCF_upper,
         variance). Default = True.
@@ -817,7 +1285,7 @@ class MCF_nonparametric:
     -------
     results : dataframe
         This is a dataframe of the results that are printed. It includes the
-        blank lines for censored values.
+        lines for censored values which are NaN (printed as blank).
     time : array
         This is the time column from results. Blank lines for censored values
         are removed.
@@ -866,173 +1334,55 @@ class MCF_nonparametric:
         self, data, CI=0.95, print_results=True, show_plot=True, plot_CI=True, **kwargs
     ):
 
-        # check input is a list
-        if type(data) == list:
-            pass
-        elif type(data) == np.ndarray:
-            data = list(data)
-        else:
-            raise ValueError("data must be a list or numpy array")
-
-        # check each item is a list and fix up any ndarrays to be lists.
-        test_for_single_system = []
-        for i, item in enumerate(data):
-            if type(item) == list:
-                test_for_single_system.append(False)
-            elif type(item) == np.ndarray:
-                data[i] = list(item)
-                test_for_single_system.append(False)
-            elif type(item) == int or type(item) == float:
-                test_for_single_system.append(True)
-            else:
-                raise ValueError(
-                    "Each item in the data must be a list or numpy array. eg. data = [[1,3,5],[3,6,8]]"
-                )
-        # Wraps the data in another list if all elements were numbers.
-        if all(test_for_single_system):  # checks if all are True
-            data = [data]
-        elif not any(test_for_single_system):  # checks if all are False
-            pass
+        if isinstance(data, tuple):
+            times, is_cens = _MCF_events_from_ids(data)
+        elif isinstance(data, np.ndarray) and data.ndim == 2:
+            times, is_cens = _MCF_events_from_padded(data)
         else:
-            raise ValueError(
-                "Mixed data types found in the data. Each item in the data must be a list or numpy array. eg. data = [[1,3,5],[3,6,8]]."
-            )
-
-        end_times = []
-        repair_times = []
-        for system in data:
-            system.sort()  # sorts the values in ascending order
-            for i, t in enumerate(system):
-                if i < len(system) - 1:
-                    repair_times.append(t)
-                else:
-                    end_times.append(t)
+            times, is_cens = _MCF_events_from_lists(data)
+        is_end = is_cens == 1
+        number_of_systems = int(is_end.sum())
 
         if CI < 0 or CI > 1:
             raise ValueError(
                 "CI must be between 0 and 1. Default is 0.95 for 95% confidence intervals (two sided)."
             )
 
-        if max(end_times) < max(repair_times):
+        last_time = times[is_end].max()
+        if last_time < times[~is_end].max():
             raise ValueError(
                 "The final end time must not be less than the final repair time."
             )
-        last_time = max(end_times)
-        C_array = ["C"] * len(end_times)
-        F_array = ["F"] * len(repair_times)
 
-        Z = -ss.norm.ppf(1 - CI)  # confidence interval converted to Z-value
+        Z = -ndtri(1 - CI)  # confidence interval converted to Z-value
 
         # sort the inputs and extract the sorted values for later use
-        times = np.hstack([repair_times, end_times])
-        states = np.hstack([F_array, C_array])
-        data = {"times": times, "states": states}
-        df = pd.DataFrame(data, columns=["times", "states"])
-        df_sorted = df.sort_values(
-            by=["times", "states"], ascending=[True, False]
-        )  # sorts the df by times and then by states, ensuring that states are F then C where the same time occurs. This ensures a failure is counted then the item is retired.
-        times_sorted = df_sorted.times.values
-        states_sorted = df_sorted.states.values
+        order = np.lexsort(
+            (is_cens, times)
+        )  # sorts by times and then by state, ensuring that states are F then C where the same time occurs. This ensures a failure is counted then the item is retired.
+        times_sorted = times[order]
+        is_failure = 1 - is_cens[order]
+        states_sorted = np.where(is_failure == 1, "F", "C")
 
         # MCF calculations
-        MCF_array = []
-        Var_array = []
-        MCF_lower_array = []
-        MCF_upper_array = []
-        r = len(end_times)
-        r_inv = 1 / r
-        C_seq = 0  # sequential number of censored values
-        for i in range(len(times)):
-            if i == 0:
-                if states_sorted[i] == "F":  # first event is a failure
-                    MCF_array.append(r_inv)
-                    Var_array.append(
-                        (r_inv ** 2) * ((1 - r_inv) ** 2 + (r - 1) * (0 - r_inv) ** 2)
-                    )
-                    MCF_lower_array.append(
-                        MCF_array[i] / np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                    )
-                    MCF_upper_array.append(
-                        MCF_array[i] * np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                    )
-                else:  # first event is censored
-                    MCF_array.append("")
-                    Var_array.append("")
-                    MCF_lower_array.append("")
-                    MCF_upper_array.append("")
-                    r -= 1
-                    if (
-                        times_sorted[i] not in end_times
-                    ):  # check if this system only has one event. If not then increment the number censored count for this system
-                        C_seq += 1
-            else:  # everything after the first time
-                if states_sorted[i] == "F":  # failure event
-                    i_adj = i - C_seq
-                    r_inv = 1 / r
-                    if (
-                        MCF_array[i_adj - 1] == ""
-                    ):  # this is the case where the first system only has one event that was censored and there is no data on the first line
-                        MCF_array.append(r_inv)
-                        Var_array.append(
-                            (r_inv ** 2)
-                            * ((1 - r_inv) ** 2 + (r - 1) * (0 - r_inv) ** 2)
-                        )
-                        MCF_lower_array.append(
-                            MCF_array[i]
-                            / np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                        )
-                        MCF_upper_array.append(
-                            MCF_array[i]
-                            * np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                        )
-                    else:  # this the normal case where there was previous data
-                        MCF_array.append(r_inv + MCF_array[i_adj - 1])
-                        Var_array.append(
-                            (r_inv ** 2)
-                            * ((1 - r_inv) ** 2 + (r - 1) * (0 - r_inv) ** 2)
-                            + Var_array[i_adj - 1]
-                        )
-                        MCF_lower_array.append(
-                            MCF_array[i]
-                            / np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                        )
-                        MCF_upper_array.append(
-                            MCF_array[i]
-                            * np.exp((Z * Var_array[i] ** 0.5) / MCF_array[i])
-                        )
-                    C_seq = 0
-                else:  # censored event
-                    r -= 1
-                    C_seq += 1
-                    MCF_array.append("")
-                    Var_array.append("")
-                    MCF_lower_array.append("")
-                    MCF_upper_array.append("")
-                    if r > 0:
-                        r_inv = 1 / r
-
-        # format output as dataframe
-        data = {
-            "state": states_sorted,
-            "time": times_sorted,
-            "MCF_lower": MCF_lower_array,
-            "MCF": MCF_array,
-            "MCF_upper": MCF_upper_array,
-            "variance": Var_array,
-        }
-        printable_results = pd.DataFrame(
-            data, columns=["state", "time", "MCF_lower", "MCF", "MCF_upper", "variance"]
+        MCF, Var, MCF_lower, MCF_upper, valid = _MCF_calculations(
+            is_failure, number_of_systems, Z
         )
+        # the results dataframe is only built if it is accessed
+        self._times_sorted = times_sorted
+        self._states_sorted = states_sorted
+        self._MCF_all = MCF
+        self._Var_all = Var
+        self._MCF_lower_all = MCF_lower
+        self._MCF_upper_all = MCF_upper
+        self._results = None
+
+        RESULTS_time = times_sorted[valid]
+        RESULTS_MCF = MCF[valid]
+        RESULTS_variance = Var[valid]
+        RESULTS_lower = MCF_lower[valid]
+        RESULTS_upper = MCF_upper[valid]
 
-        indices_to_drop = printable_results[printable_results["state"] == "C"].index
-        plotting_results = printable_results.drop(indices_to_drop, inplace=False)
-        RESULTS_time = plotting_results.time.values
-        RESULTS_MCF = plotting_results.MCF.values
-        RESULTS_variance = plotting_results.variance.values
-        RESULTS_lower = plotting_results.MCF_lower.values
-        RESULTS_upper = plotting_results.MCF_upper.values
-
-        self.results = printable_results
         self.time = RESULTS_time
         self.MCF = RESULTS_MCF
         self.lower = RESULTS_lower
@@ -1044,42 +1394,36 @@ class MCF_nonparametric:
             CI_rounded = int(CI * 100)
 
         if print_results is True:
-            pd.set_option(
-                "display.width", 200
-            )  # prevents wrapping after default 80 characters
-            pd.set_option(
-                "display.max_columns", 9
-            )  # shows the dataframe without ... truncation
             colorprint(
                 str("Mean Cumulative Function results (" + str(CI_rounded) + "% CI):"),
                 bold=True,
                 underline=True,
             )
-            print(self.results.to_string(index=False), "\n")
+            print(
+                _format_mcf_table(
+                    states_sorted, times_sorted, MCF_lower, MCF, MCF_upper, Var
+                ),
+                "\n",
+            )
 
         if show_plot is True:
-            x_MCF = [0, RESULTS_time[0]]
-            y_MCF = [0, 0]
-            y_upper = [0, 0]
-            y_lower = [0, 0]
-            x_MCF.append(RESULTS_time[0])
-            y_MCF.append(RESULTS_MCF[0])
-            y_upper.append(RESULTS_upper[0])
-            y_lower.append(RESULTS_lower[0])
-            for i, t in enumerate(RESULTS_time):
-                if i > 0:
-                    x_MCF.append(RESULTS_time[i])
-                    y_MCF.append(RESULTS_MCF[i - 1])
-                    y_upper.append(RESULTS_upper[i - 1])
-                    y_lower.append(RESULTS_lower[i - 1])
-                    x_MCF.append(RESULTS_time[i])
-                    y_MCF.append(RESULTS_MCF[i])
-                    y_upper.append(RESULTS_upper[i])
-                    y_lower.append(RESULTS_lower[i])
-            x_MCF.append(last_time)  # add the last horizontal line
-            y_MCF.append(RESULTS_MCF[-1])
-            y_upper.append(RESULTS_upper[-1])
-            y_lower.append(RESULTS_lower[-1])
+            import matplotlib.pyplot as plt
+
+            # the staircase steps up at each time so every time is repeated
+            # and the MCF starts from zero and ends at the last time
+            k = len(RESULTS_time)
+            x_MCF = np.empty(2 * k + 2)
+            x_MCF[0] = 0
+            x_MCF[1:-1:2] = RESULTS_time
+            x_MCF[2:-1:2] = RESULTS_time
+            x_MCF[-1] = last_time  # add the last horizontal line
+            y_MCF, y_upper, y_lower = np.empty((3, 2 * k + 2))
+            for y, values in zip(
+                [y_MCF, y_upper, y_lower], [RESULTS_MCF, RESULTS_upper, RESULTS_lower]
+            ):
+                y[0:2] = 0
+                y[2::2] = values
+                y[3::2] = values
             title_str = "Non-parametric estimate of the Mean Cumulative Function"
 
             if "color" in kwargs:
@@ -1103,6 +1447,28 @@ class MCF_nonparametric:
             plt.xlim(0, last_time)
             plt.ylim(0, max(RESULTS_upper) * 1.05)
 
+    @property
+    def results(self):
+        """
+        The dataframe of the results. It is built the first time it is
+        accessed and then reused.
+        """
+        if self._results is None:
+            data = {
+                "state": self._states_sorted,
+                "time": self._times_sorted,
+                "MCF_lower": self._MCF_lower_all,
+                "MCF": self._MCF_all,
+                "MCF_upper": self._MCF_upper_all,
+                "variance": self._Var_all,
+            }
+            self._results = pd.DataFrame(
+                data,
+                columns=["state", "time", "MCF_lower", "MCF", "MCF_upper", "variance"],
+                copy=False,
+            )
+        return self._results
+
 
 class MCF_parametric:
     """
@@ -1134,7 +1500,10 @@ class MCF_parametric:
         be entered as data = [4,7,9,9] since the last value is treated as a
         right censored value. If you only have data from 1 system you may enter
         the data in a single list as data = [3,7,12] and it will be nested
-        within another list automatically.
+        within another list automatically. The data may also be a 2D array with
+        one row for each system padded with NaN, or a tuple of
+        (times, system_ids) where system_ids gives the system of each time. eg.
+        data=([4,7,9,3,8,12],[1,1,1,2,2,2]) is the same as the example above.
     print_results : bool, optional
         Prints the table of MCF results (state, time, MCF_lower, MCF, MCF_upper,
         variance). Default = True.
@@ -1225,9 +1594,8 @@ class MCF_parametric:
         self.MCF = MCF_NP.MCF
 
         # initial guess using least squares regression of linearised function
-        # we must convert this back to list due to an issue within numpy dealing with the log of floats
-        ln_x = np.log(list(self.times))
-        ln_y = np.log(list(self.MCF))
+        ln_x = np.log(self.times)
+        ln_y = np.log(self.MCF)
         guess_fit = np.polyfit(ln_x, ln_y, deg=1)
         beta_guess = guess_fit[0]
         alpha_guess = np.exp(-guess_fit[1] / beta_guess)
@@ -1236,11 +1604,17 @@ class MCF_parametric:
             beta_guess,
         ]  # guess for curve_fit. This guess is good but curve fit makes it much better.
 
-        # actual fitting using curve_fit with initial guess from least squares
-        def __MCF_eqn(t, a, b):  # objective function for curve_fit
-            return (t / a) ** b
-
-        fit = curve_fit(__MCF_eqn, self.times, self.MCF, p0=guess)
+        # actual fitting using curve_fit with initial guess from least squares.
+        # The analytic jacobian avoids the finite difference evaluations of
+        # _MCF_eqn. The inputs come from MCF_nonparametric so they are finite.
+        fit = curve_fit(
+            _MCF_eqn,
+            self.times,
+            self.MCF,
+            p0=guess,
+            jac=_MCF_jac,
+            check_finite=False,
+        )
         alpha = fit[0][0]
         beta = fit[0][1]
         var_alpha = fit[1][0][
@@ -1249,7 +1623,7 @@ class MCF_parametric:
         var_beta = fit[1][1][1]
         cov_alpha_beta = fit[1][0][1]
 
-        Z = -ss.norm.ppf((1 - CI) / 2)
+        Z = -ndtri((1 - CI) / 2)
         self.alpha = alpha
         self.alpha_SE = var_alpha ** 0.5
         self.beta = beta
@@ -1260,23 +1634,7 @@ class MCF_parametric:
         self.beta_upper = self.beta * (np.exp(Z * (self.beta_SE / self.beta)))
         self.beta_lower = self.beta * (np.exp(-Z * (self.beta_SE / self.beta)))
 
-        Data = {
-            "Parameter": ["Alpha", "Beta"],
-            "Point Estimate": [self.alpha, self.beta],
-            "Standard Error": [self.alpha_SE, self.beta_SE],
-            "Lower CI": [self.alpha_lower, self.beta_lower],
-            "Upper CI": [self.alpha_upper, self.beta_upper],
-        }
-        self.results = pd.DataFrame(
-            Data,
-            columns=[
-                "Parameter",
-                "Point Estimate",
-                "Standard Error",
-                "Lower CI",
-                "Upper CI",
-            ],
-        )
+        self._results = None  # the results dataframe is only built if it is used
 
         if print_results is True:
             CI_rounded = CI * 100
@@ -1307,6 +1665,8 @@ class MCF_parametric:
                 )
 
         if show_plot is True:
+            import matplotlib.pyplot as plt
+
             if "color" in kwargs:
                 color = kwargs.pop("color")
                 marker_color = "k"
@@ -1325,20 +1685,15 @@ class MCF_parametric:
                 label = r"$\hat{MCF} = (\frac{t}{\alpha})^\beta$"
 
             x_line = np.linspace(0.001, max(self.times) * 10, 1000)
-            y_line = (x_line / alpha) ** beta
+            if plot_CI is True:
+                y_line, y_line_lower, y_line_upper = _MCF_CI_bands(
+                    x_line, alpha, beta, var_alpha, var_beta, cov_alpha_beta, Z
+                )
+            else:
+                y_line = (x_line / alpha) ** beta
             plt.plot(x_line, y_line, color=color, label=label, **kwargs)
 
             if plot_CI is True:
-                p1 = -(beta / alpha) * (x_line / alpha) ** beta
-                p2 = ((x_line / alpha) ** beta) * np.log(x_line / alpha)
-                var = (
-                    var_alpha * p1 ** 2
-                    + var_beta * p2 ** 2
-                    + 2 * p1 * p2 * cov_alpha_beta
-                )
-                SD = var ** 0.5
-                y_line_lower = y_line * np.exp((-Z * SD) / y_line)
-                y_line_upper = y_line * np.exp((Z * SD) / y_line)
                 plt.fill_between(
                     x_line,
                     y_line_lower,
@@ -1363,3 +1718,29 @@ class MCF_parametric:
             plt.xlim(0, max(self.times) * 1.2)
             plt.ylim(0, max(self.MCF) * 1.4)
             plt.title(title_str)
+
+    @property
+    def results(self):
+        """
+        The dataframe of the parameters and their confidence bounds. It is
+        built the first time it is accessed and then reused.
+        """
+        if self._results is None:
+            Data = {
+                "Parameter": ["Alpha", "Beta"],
+                "Point Estimate": [self.alpha, self.beta],
+                "Standard Error": [self.alpha_SE, self.beta_SE],
+                "Lower CI": [self.alpha_lower, self.beta_lower],
+                "Upper CI": [self.alpha_upper, self.beta_upper],
+            }
+            self._results = pd.DataFrame(
+                Data,
+                columns=[
+                    "Parameter",
+                    "Point Estimate",
+                    "Standard Error",
+                    "Lower CI",
+                    "Upper CI",
+                ],
+            )
+        return self._results
@@ -9,11 +9,25 @@ from reliability_extension import Reliability_testing
 from reliability_extension import Repairable_systems
 from reliability_extension import Probability_plotting
 from reliability_extension import Datasets
-from reliability_extension import ALT_fitters
-from reliability_extension import PoF
 from reliability_extension import Utils
 from reliability_extension import Convert_data
 from datetime import date
+import importlib
+
+# these modules are rarely needed in scripted workflows so they are only
+# imported the first time they are accessed (PEP 562)
+_lazy_modules = ["ALT_fitters", "PoF"]
+
+
+def __getattr__(name):
+    if name in _lazy_modules:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_modules))
+
 
 __title__ = 'reliability_extension'
 __version__ = "0.8.1"
@@ -1,5 +1,6 @@
 from reliability_extension.Datasets import MCF_1
 from reliability_extension.Repairable_systems import reliability_growth, optimal_replacement_time, ROCOF, MCF_nonparametric, MCF_parametric
+import numpy as np
 from numpy.testing import assert_allclose
 atol = 1e-8
 rtol = 1e-7
@@ -32,7 +33,7 @@ def test_reliability_growth_crow_amsaa():
 def test_optimal_replacement_time():
     ort0 = optimal_replacement_time(cost_PM=1, cost_CM=5, weibull_alpha=1000,
         weibull_beta=2.5, q=0)
-    assert_allclose(ort0.ORT,493.1851185118512,rtol=rtol,atol=atol)
+    assert_allclose(ort0.ORT,493.04695128097023,rtol=rtol,atol=atol)
     assert_allclose(ort0.min_cost, 0.0034620429189943167, rtol=rtol, atol=atol)
     ort1 = optimal_replacement_time(cost_PM=1, cost_CM=5, weibull_alpha=1000,
         weibull_beta=2.5, q=1)
@@ -40,6 +41,18 @@ def test_optimal_replacement_time():
     assert_allclose(ort1.min_cost, 0.0051483404213951, rtol=rtol, atol=atol)
 
 
+def test_optimal_replacement_time_search_edges():
+    # alpha * 3 < 1 so the coarse grid runs downward from 1
+    ort_small = optimal_replacement_time(cost_PM=1, cost_CM=5, weibull_alpha=0.2,
+        weibull_beta=2.5, q=0, show_time_plot=False, show_ratio_plot=False, print_results=False)
+    assert_allclose(ort_small.ORT, 0.6, rtol=rtol, atol=atol)
+    assert_allclose(ort_small.min_cost, 28.176509020548473, rtol=rtol, atol=atol)
+    # the minimum is at the end of the search range so the optimum is reactive
+    ort_edge = optimal_replacement_time(cost_PM=1, cost_CM=5, weibull_alpha=1000,
+        weibull_beta=1.05, q=0, show_time_plot=False, show_ratio_plot=False, print_results=False)
+    assert ort_edge.optimal_reactive_ratio == 1
+
+
 def test_ROCOF():
     times = [104, 131, 1597, 59, 4, 503, 157, 6, 118, 173, 114, 62, 101, 216, 106, 140, 1, 102, 3, 393, 96, 232, 89, 61, 37, 293, 7, 165, 87, 99]
     results = ROCOF(times_between_failures=times, show_plot=False, print_results=False)
@@ -73,3 +86,20 @@ def test_MCF_parametric():
     assert_allclose(results.beta_upper, 1.8698127619704332, rtol=rtol, atol=atol)
 
 
+def test_MCF_nonparametric_array_inputs():
+    data = [[5, 10, 15, 17], [6, 13, 17, 19], [12, 20, 25, 26], [13, 15, 24], [16, 22, 25, 28]]
+    expected = MCF_nonparametric(data=data, show_plot=False, print_results=False)
+    padded = np.full((5, 4), np.nan)
+    for i, system in enumerate(data):
+        padded[i, : len(system)] = system[::-1]  # order within a row does not matter
+    times = np.hstack(data)
+    system_ids = np.repeat(np.arange(5), [len(system) for system in data])
+    order = np.random.RandomState(0).permutation(len(times))
+    for arg in [padded, (times[order], system_ids[order])]:
+        results = MCF_nonparametric(data=arg, show_plot=False, print_results=False)
+        assert_allclose(results.time, expected.time, rtol=rtol, atol=atol)
+        assert_allclose(results.MCF, expected.MCF, rtol=rtol, atol=atol)
+        assert_allclose(results.variance, expected.variance, rtol=rtol, atol=atol)
+        assert_allclose(results.lower, expected.lower, rtol=rtol, atol=atol)
+        assert_allclose(results.upper, expected.upper, rtol=rtol, atol=atol)
+        assert list(results.results.state) == list(expected.results.state)